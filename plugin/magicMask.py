@@ -1,14 +1,27 @@
 # -*- coding: utf-8 -*-
 
+import io
+import math
+import os
 import sys
+import time
+import collections
 import maya.api.OpenMaya as OpenMaya
 import maya.api.OpenMayaUI as OpenMayaUI
 import maya.api.OpenMayaRender as OpenMayaRender
 import maya.api.OpenMayaAnim as OpenMayaAnim
 import pymel.core as pm
 
+try:
+    from PySide2 import QtGui
+except ImportError:
+    try:
+        from PySide6 import QtGui
+    except ImportError:
+        QtGui = None
+
 
-PLUGIN_VERSION = '1.0.0'
+PLUGIN_VERSION = '1.1.0'
 NODE_NAME = 'magicMask'
 NODE_ID = OpenMaya.MTypeId(0x87072)
 
@@ -29,11 +42,224 @@ FONT_WEIGHT_MAP = {
     'Bold': 75,  # kWeightBold = 75
 }
 
+TEXT_FIT_MODES = ['None', 'Shrink', 'Truncate']
+TEXT_ELLIPSIS = '...'
+TEXT_MIN_FONT_SIZE = 6
+TEXT_METRICS_CACHE_SIZE = 1024
+TEXT_LINE_SPACING = 1.2
+DRAW_PLAN_CACHE_SIZE = 4  # viewport sizes kept per node, e.g. a four panel layout
+TEXT_FALLBACK_CHAR_WIDTH = 0.6  # average glyph width / font size, used when Qt is not available
+
+REFRESH_TICK = 0.1  # seconds between scheduler checks, caps refresh_rate at 10 per second
+REFRESH_MIN_RATE = 0.1
+
 
 def maya_useNewAPI():
     pass
 
 
+class TextMetrics(object):
+    """
+    Measure text widths in pixels.
+    Every (text, font size, font weight) is measured once and kept in a bounded LRU cache,
+    so only strings that actually changed (e.g. the frame counter) hit the font metrics.
+    """
+
+    def __init__(self, font_name='', cache_size=TEXT_METRICS_CACHE_SIZE):
+        self.font_name = font_name
+        self.cache_size = cache_size
+        self._widths = collections.OrderedDict()
+        self._font_metrics = {}
+
+    def width(self, text, font_size, font_weight):
+        key = (text, font_size, font_weight)
+        try:
+            value = self._widths.pop(key)
+        except KeyError:
+            value = self._measure(text, font_size, font_weight)
+            if len(self._widths) >= self.cache_size:
+                self._widths.popitem(last=False)
+        self._widths[key] = value
+        return value
+
+    def fit(self, text, font_size, font_weight, max_width, fit_mode):
+        """
+        Fit text into max_width pixels.
+        'Shrink' lowers the font size down to TEXT_MIN_FONT_SIZE and truncates if it still overflows,
+        'Truncate' cuts the text with an ellipsis, 'None' leaves it untouched.
+        :return: (text, font_size)
+        """
+        if fit_mode not in ('Shrink', 'Truncate') or not text:
+            return text, font_size
+        width = self.width(text, font_size, font_weight)
+        if width <= max_width:
+            return text, font_size
+
+        if fit_mode == 'Shrink' and font_size > TEXT_MIN_FONT_SIZE:
+            font_size = max(min(int(font_size * max_width / width), font_size - 1), TEXT_MIN_FONT_SIZE)
+            while font_size > TEXT_MIN_FONT_SIZE and self.width(text, font_size, font_weight) > max_width:
+                font_size -= 1
+            if self.width(text, font_size, font_weight) <= max_width:
+                return text, font_size
+
+        return self.truncate(text, font_size, font_weight, max_width), font_size
+
+    def truncate(self, text, font_size, font_weight, max_width):
+        if self.width(TEXT_ELLIPSIS, font_size, font_weight) > max_width:
+            return ''
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.width(text[:middle].rstrip() + TEXT_ELLIPSIS, font_size, font_weight) <= max_width:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low].rstrip() + TEXT_ELLIPSIS
+
+    def _measure(self, text, font_size, font_weight):
+        # QFontMetrics needs a gui application, mayapy/batch falls back to an estimate
+        if QtGui is None or QtGui.QGuiApplication.instance() is None:
+            return len(text) * font_size * TEXT_FALLBACK_CHAR_WIDTH
+
+        # MUIDrawManager font sizes are pixel heights in viewport (device) pixels, the same space as
+        # getViewportDimensions, so the font is sized with setPixelSize which is not affected by the
+        # screen dpi; on HiDPI screens both sides scale together and widths stay comparable
+        font_key = (font_size, font_weight)
+        metrics = self._font_metrics.get(font_key)
+        if metrics is None:
+            # VP2's default font is not exposed, without a text_font the Qt application font is
+            # an approximation of it; set text_font for measurements matching the drawn text
+            font = QtGui.QFont(self.font_name) if self.font_name else QtGui.QFont()
+            font.setPixelSize(max(font_size, 1))
+            for weight_name, weight_value in FONT_WEIGHT_MAP.items():
+                if weight_value == font_weight:
+                    font.setWeight(getattr(QtGui.QFont, weight_name))
+            metrics = QtGui.QFontMetrics(font)
+            self._font_metrics[font_key] = metrics
+        if hasattr(metrics, 'horizontalAdvance'):
+            return metrics.horizontalAdvance(text)
+        return metrics.width(text)
+
+
+NOTE_FILE_CACHE = {}  # {path: ((mtime, size), text)}
+
+
+def read_note_file(path):
+    # re-read only when the file's mtime / size changed
+    try:
+        stat = os.stat(path)
+    except OSError:
+        NOTE_FILE_CACHE.pop(path, None)
+        return ''
+    signature = (stat.st_mtime, stat.st_size)
+    cached = NOTE_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    try:
+        with io.open(path, 'r', encoding='utf-8', errors='replace') as note_file:
+            text = note_file.read().strip()
+    except (IOError, OSError):
+        text = ''
+    NOTE_FILE_CACHE[path] = (signature, text)
+    return text
+
+
+def live_text_fields(mask_node):
+    """
+    Collect the fields which change without any scene evaluation (wall-clock, note file).
+    :return: {text position: string}
+    """
+    fields = {}
+    clock_position = mask_node.findPlug('clock_position', False).asInt()
+    if 0 <= clock_position < MagicMaskNode.TEXT_POSITION_NUMBER:
+        clock_format = mask_node.findPlug('clock_format', False).asString()
+        try:
+            fields[clock_position] = time.strftime(clock_format)
+        except ValueError:
+            # invalid directives raise on Windows, show the format as typed instead
+            fields[clock_position] = clock_format
+
+    note_position = mask_node.findPlug('note_position', False).asInt()
+    if 0 <= note_position < MagicMaskNode.TEXT_POSITION_NUMBER:
+        note_path = mask_node.findPlug('note_file', False).asString()
+        fields[note_position] = read_note_file(note_path) if note_path else ''
+    return fields
+
+
+class RefreshScheduler(object):
+    """
+    Timer driven viewport refresh for the live text fields.
+    Each node is checked at most refresh_rate times per second, and a redraw is only
+    requested when one of its rendered live strings actually changed, so idle scenes stay idle.
+    As it already tracks node lifetime, it also removes the nodes' message callbacks.
+    """
+
+    def __init__(self):
+        self.callback_id = None
+        self.nodes = {}  # {object hash code: [MObjectHandle, next check time, live fields, callback ids]}
+
+    def start(self):
+        if self.callback_id is None:
+            self.callback_id = OpenMaya.MTimerMessage.addTimerCallback(REFRESH_TICK, self.tick)
+
+    def stop(self):
+        if self.callback_id is not None:
+            OpenMaya.MMessage.removeCallback(self.callback_id)
+            self.callback_id = None
+        for entry in self.nodes.values():
+            OpenMaya.MMessage.removeCallbacks(entry[3])
+        self.nodes.clear()
+
+    def add_node(self, node_object, callback_ids=()):
+        handle = OpenMaya.MObjectHandle(node_object)
+        self.nodes[handle.hashCode()] = [handle, 0.0, {}, list(callback_ids)]
+
+    def invalidate(self, node_object):
+        # poll on the next tick instead of waiting out the current period
+        entry = self.nodes.get(OpenMaya.MObjectHandle(node_object).hashCode())
+        if entry is not None:
+            entry[1] = 0.0
+
+    def live_fields(self, node_object):
+        # last strings polled by the timer, drawing never touches the clock / note file itself
+        entry = self.nodes.get(OpenMaya.MObjectHandle(node_object).hashCode())
+        if entry is None:
+            return {}
+        return entry[2]
+
+    def tick(self, elapsed_time, last_time, client_data):
+        now = time.time()
+        refresh = False
+        for key, entry in list(self.nodes.items()):
+            handle, next_time, last_fields, callback_ids = entry
+            if not handle.isAlive():
+                OpenMaya.MMessage.removeCallbacks(callback_ids)
+                del self.nodes[key]
+                continue
+            # deleted but still in the undo queue
+            if not handle.isValid() or now < next_time:
+                continue
+
+            node_object = handle.object()
+            mask_node = OpenMaya.MFnDependencyNode(node_object)
+            # a connection can drive the plug below its min
+            period = 1.0 / max(mask_node.findPlug('refresh_rate', False).asFloat(), REFRESH_MIN_RATE)
+            # checks sit on a fixed grid of the period instead of now + period, so they do not drift
+            # against the clock's second / minute boundaries and a clock never skips a value
+            entry[1] = (math.floor(now / period) + 1) * period
+            fields = live_text_fields(mask_node)
+            if fields != last_fields:
+                entry[2] = fields
+                OpenMayaRender.MRenderer.setGeometryDrawDirty(node_object)
+                refresh = True
+
+        if refresh:
+            OpenMayaUI.M3dView.scheduleRefreshAllViews()
+
+
+REFRESH_SCHEDULER = RefreshScheduler()
+
+
 class MagicMaskData(OpenMaya.MUserData):
     def __init__(self):
         super(MagicMaskData, self).__init__(False)
@@ -49,9 +275,16 @@ class MagicMaskNode(OpenMayaUI.MPxLocatorNode):
         'bottom_left_text', 'bottom_center_text', 'bottom_right_text'
     ]
     TEXT_POSITION_NUMBER = 6
+    LIVE_ATTRIBUTES = ['clock_position', 'clock_format', 'note_position', 'note_file', 'refresh_rate']
 
     def __init__(self):
         OpenMayaUI.MPxLocatorNode.__init__(self)
+        self.text_styles = None  # cached by the draw override, reset on any attribute change
+
+    def attribute_changed(self, message, plug, other_plug, client_data):
+        self.text_styles = None
+        if OpenMaya.MFnAttribute(plug.attribute()).name in self.LIVE_ATTRIBUTES:
+            REFRESH_SCHEDULER.invalidate(self.thisMObject())
 
     def excludeAsLocator(self):
         return False
@@ -71,6 +304,11 @@ class MagicMaskNode(OpenMayaUI.MPxLocatorNode):
             plug.isChannelBox = False
             plug.isKeyable = False
 
+        attribute_changed_id = OpenMaya.MNodeMessage.addAttributeChangedCallback(
+            this_object, self.attribute_changed
+        )
+        REFRESH_SCHEDULER.add_node(this_object, [attribute_changed_id])
+
     @classmethod
     def initialize(cls):
         typed_attr = OpenMaya.MFnTypedAttribute()
@@ -140,6 +378,58 @@ class MagicMaskNode(OpenMayaUI.MPxLocatorNode):
         numeric_attr.setMax(5.0)
         cls.addAttribute(cls.bottom_text_scale)
 
+        cls.top_text_fit = enum_attr.create('top_text_fit', 'top_text_fit', 0)
+        for index, fit_mode in enumerate(TEXT_FIT_MODES):
+            enum_attr.addField(fit_mode, index)
+        cls.addAttribute(cls.top_text_fit)
+
+        cls.bottom_text_fit = enum_attr.create('bottom_text_fit', 'bottom_text_fit', 0)
+        for index, fit_mode in enumerate(TEXT_FIT_MODES):
+            enum_attr.addField(fit_mode, index)
+        cls.addAttribute(cls.bottom_text_fit)
+
+        # empty keeps the viewport's default font
+        cls.text_font = typed_attr.create('text_font', 'text_font', OpenMaya.MFnData.kString)
+        cls.addAttribute(cls.text_font)
+
+        # per slot style, used instead of the top / bottom style when <slot>_style_override is on
+        for text_attribute in cls.TEXT_ATTRIBUTES:
+            attr = numeric_attr.create(
+                '{0}_style_override'.format(text_attribute), '{0}_style_override'.format(text_attribute),
+                OpenMaya.MFnNumericData.kBoolean, False
+            )
+            cls.addAttribute(attr)
+
+            attr = numeric_attr.createColor(
+                '{0}_color'.format(text_attribute), '{0}_color'.format(text_attribute)
+            )
+            numeric_attr.default = (1.0, 1.0, 1.0)
+            cls.addAttribute(attr)
+
+            attr = numeric_attr.create(
+                '{0}_alpha'.format(text_attribute), '{0}_alpha'.format(text_attribute),
+                OpenMaya.MFnNumericData.kFloat, 1.0
+            )
+            numeric_attr.setMin(0.0)
+            numeric_attr.setMax(1.0)
+            cls.addAttribute(attr)
+
+            attr = enum_attr.create(
+                '{0}_font_weight'.format(text_attribute), '{0}_font_weight'.format(text_attribute), 2
+            )
+            enum_attr.addField('Normal', 0)
+            enum_attr.addField('DemiBold', 1)
+            enum_attr.addField('Bold', 2)
+            cls.addAttribute(attr)
+
+            attr = numeric_attr.create(
+                '{0}_scale'.format(text_attribute), '{0}_scale'.format(text_attribute),
+                OpenMaya.MFnNumericData.kFloat, 1.0
+            )
+            numeric_attr.setMin(0.2)
+            numeric_attr.setMax(5.0)
+            cls.addAttribute(attr)
+
         cls.top_border_enabled = numeric_attr.create(
             'top_border_enabled', 'top_border_enabled', OpenMaya.MFnNumericData.kBoolean, True
         )
@@ -238,6 +528,35 @@ class MagicMaskNode(OpenMayaUI.MPxLocatorNode):
         numeric_attr.setMax(6)
         cls.addAttribute(cls.focal_length_position)
 
+        cls.clock_position = numeric_attr.create(
+            'clock_position', 'clock_position', OpenMaya.MFnNumericData.kInt, 6
+        )
+        numeric_attr.setMin(0)
+        numeric_attr.setMax(6)
+        cls.addAttribute(cls.clock_position)
+
+        string_data = OpenMaya.MFnStringData().create('%Y-%m-%d %H:%M:%S')
+        cls.clock_format = typed_attr.create('clock_format', 'clock_format', OpenMaya.MFnData.kString, string_data)
+        cls.addAttribute(cls.clock_format)
+
+        cls.note_position = numeric_attr.create(
+            'note_position', 'note_position', OpenMaya.MFnNumericData.kInt, 6
+        )
+        numeric_attr.setMin(0)
+        numeric_attr.setMax(6)
+        cls.addAttribute(cls.note_position)
+
+        cls.note_file = typed_attr.create('note_file', 'note_file', OpenMaya.MFnData.kString)
+        typed_attr.usedAsFilename = True
+        cls.addAttribute(cls.note_file)
+
+        cls.refresh_rate = numeric_attr.create(
+            'refresh_rate', 'refresh_rate', OpenMaya.MFnNumericData.kFloat, 1.0
+        )
+        numeric_attr.setMin(REFRESH_MIN_RATE)
+        numeric_attr.setMax(1.0 / REFRESH_TICK)
+        cls.addAttribute(cls.refresh_rate)
+
     @classmethod
     def creator(cls):
         return cls()
@@ -286,6 +605,9 @@ class MagicMaskDrawOverride(OpenMayaRender.MPxDrawOverride):
 
     def __init__(self, obj):
         super(MagicMaskDrawOverride, self).__init__(obj, MagicMaskDrawOverride.draw)
+        self.text_metrics = TextMetrics()
+        self.slot_layouts = collections.OrderedDict()
+        self.draw_plans = collections.OrderedDict()  # {viewport geometry: (plan key, draw plan)}
 
     def supportedDrawAPIs(self):
         return (
@@ -311,33 +633,31 @@ class MagicMaskDrawOverride(OpenMayaRender.MPxDrawOverride):
 
         data.top_text_padding = mask_node.findPlug('top_text_padding', False).asInt()
         data.bottom_text_padding = mask_node.findPlug('bottom_text_padding', False).asInt()
-        data.top_text_scale = mask_node.findPlug('top_text_scale', False).asFloat()
-        data.bottom_text_scale = mask_node.findPlug('bottom_text_scale', False).asFloat()
-
-        top_text_color_r = mask_node.findPlug('top_text_colorR', False).asFloat()
-        top_text_color_g = mask_node.findPlug('top_text_colorG', False).asFloat()
-        top_text_color_b = mask_node.findPlug('top_text_colorB', False).asFloat()
-        top_text_color_a = mask_node.findPlug('top_text_alpha', False).asFloat()
-        data.top_text_color = OpenMaya.MColor(
-            (top_text_color_r, top_text_color_g, top_text_color_b, top_text_color_a)
+        data.text_font = mask_node.findPlug('text_font', False).asString()
+
+        user_node = mask_node.userNode()
+        data.text_styles = user_node.text_styles
+        if data.text_styles is None:
+            text_styles = []
+            connected = False
+            for attribute in MagicMaskNode.TEXT_ATTRIBUTES:
+                override_plug = mask_node.findPlug('{0}_style_override'.format(attribute), False)
+                prefix = attribute if override_plug.asBool() else attribute.split('_')[0] + '_text'
+                style, style_connected = self.read_text_style(mask_node, prefix)
+                text_styles.append(style)
+                connected = connected or style_connected or override_plug.isDestination
+            data.text_styles = tuple(text_styles)
+            # driven styles change without an attribute changed message, those are read every draw
+            if not connected:
+                user_node.text_styles = data.text_styles
+
+        top_text_fit_plug = mask_node.findPlug('top_text_fit', False)
+        data.top_text_fit = OpenMaya.MFnEnumAttribute(top_text_fit_plug.attribute()).fieldName(
+            top_text_fit_plug.asShort()
         )
-        top_text_font_weight_plug = mask_node.findPlug('top_text_font_weight', False)
-        top_text_font_weight_attr = OpenMaya.MFnEnumAttribute(top_text_font_weight_plug.attribute())
-        data.top_text_font_weight = FONT_WEIGHT_MAP.get(
-            top_text_font_weight_attr.fieldName(top_text_font_weight_plug.asShort())
-        )
-
-        bottom_text_color_r = mask_node.findPlug('bottom_text_colorR', False).asFloat()
-        bottom_text_color_g = mask_node.findPlug('bottom_text_colorG', False).asFloat()
-        bottom_text_color_b = mask_node.findPlug('bottom_text_colorB', False).asFloat()
-        bottom_text_color_a = mask_node.findPlug('bottom_text_alpha', False).asFloat()
-        data.bottom_text_color = OpenMaya.MColor(
-            (bottom_text_color_r, bottom_text_color_g, bottom_text_color_b, bottom_text_color_a)
-        )
-        bottom_text_font_weight_plug = mask_node.findPlug('bottom_text_font_weight', False)
-        bottom_text_font_weight_attr = OpenMaya.MFnEnumAttribute(bottom_text_font_weight_plug.attribute())
-        data.bottom_text_font_weight = FONT_WEIGHT_MAP.get(
-            bottom_text_font_weight_attr.fieldName(bottom_text_font_weight_plug.asShort())
+        bottom_text_fit_plug = mask_node.findPlug('bottom_text_fit', False)
+        data.bottom_text_fit = OpenMaya.MFnEnumAttribute(bottom_text_fit_plug.attribute()).fieldName(
+            bottom_text_fit_plug.asShort()
         )
 
         border_color_r = mask_node.findPlug('border_colorR', False).asFloat()
@@ -385,8 +705,28 @@ class MagicMaskDrawOverride(OpenMayaRender.MPxDrawOverride):
             focal_length_string = 'Focal Length: %.2f' % camera.focalLength
             data.text_fields[focal_length_position] = focal_length_string
 
+        for position, live_string in REFRESH_SCHEDULER.live_fields(obj_path.node()).items():
+            data.text_fields[position] = live_string
+
         return data
 
+    @staticmethod
+    def read_text_style(mask_node, prefix):
+        # hashable (color, scale, font weight), it is part of the draw plan key
+        color_plug = mask_node.findPlug('{0}_color'.format(prefix), False)
+        alpha_plug = mask_node.findPlug('{0}_alpha'.format(prefix), False)
+        scale_plug = mask_node.findPlug('{0}_scale'.format(prefix), False)
+        font_weight_plug = mask_node.findPlug('{0}_font_weight'.format(prefix), False)
+        color_plugs = [color_plug.child(index) for index in range(3)]
+
+        color = tuple(plug.asFloat() for plug in color_plugs) + (alpha_plug.asFloat(),)
+        font_weight_attr = OpenMaya.MFnEnumAttribute(font_weight_plug.attribute())
+        font_weight = FONT_WEIGHT_MAP.get(font_weight_attr.fieldName(font_weight_plug.asShort()))
+        connected = any(
+            plug.isDestination for plug in [color_plug, alpha_plug, scale_plug, font_weight_plug] + color_plugs
+        )
+        return (color, scale_plug.asFloat(), font_weight), connected
+
     def hasUIDrawables(self):
         return True
 
@@ -467,39 +807,131 @@ class MagicMaskDrawOverride(OpenMayaRender.MPxDrawOverride):
                 dynamic=False
             )
 
-        draw_manager.setColor(data.top_text_color)
-        draw_manager.setFontSize(int(border_height * 0.25 * data.top_text_scale))
-        draw_manager.setFontWeight(data.top_text_font_weight)
-        self.draw_text(
-            draw_manager, OpenMaya.MPoint(mask_x+data.top_text_padding, mask_y_top-border_height),
-            data.text_fields[0], OpenMayaRender.MUIDrawManager.kLeft, background_size
-        )
-        self.draw_text(
-            draw_manager, OpenMaya.MPoint(viewport_width*0.5, mask_y_top-border_height),
-            data.text_fields[1], OpenMayaRender.MUIDrawManager.kCenter, background_size
-        )
-        self.draw_text(
-            draw_manager, OpenMaya.MPoint(mask_x+mask_width-data.top_text_padding, mask_y_top-border_height),
-            data.text_fields[2], OpenMayaRender.MUIDrawManager.kRight, background_size
-        )
+        if data.text_font != self.text_metrics.font_name:
+            # every cached width and layout was measured with the previous font
+            self.text_metrics = TextMetrics(data.text_font)
+            self.slot_layouts.clear()
+            self.draw_plans.clear()
+        draw_plan = self.get_draw_plan(data, mask_x, mask_width, mask_y_top, mask_y_bottom, background_size)
+
+        if data.text_font:
+            draw_manager.setFontName(data.text_font)
+        color = font_size = font_weight = None
+        for (group_color, group_font_size, group_font_weight), draw_color, lines in draw_plan:
+            if group_color != color:
+                color = group_color
+                draw_manager.setColor(draw_color)
+            if group_font_size != font_size:
+                font_size = group_font_size
+                draw_manager.setFontSize(font_size)
+            if group_font_weight != font_weight:
+                font_weight = group_font_weight
+                draw_manager.setFontWeight(font_weight)
+            for position, text, alignment, line_background_size in lines:
+                self.draw_text(draw_manager, position, text, alignment, line_background_size)
 
-        draw_manager.setColor(data.bottom_text_color)
-        draw_manager.setFontSize(int(border_height * 0.25 * data.bottom_text_scale))
-        draw_manager.setFontWeight(data.bottom_text_font_weight)
-        self.draw_text(
-            draw_manager, OpenMaya.MPoint(mask_x+data.bottom_text_padding, mask_y_bottom),
-            data.text_fields[3], OpenMayaRender.MUIDrawManager.kLeft, background_size
-        )
-        self.draw_text(
-            draw_manager, OpenMaya.MPoint(viewport_width*0.5, mask_y_bottom),
-            data.text_fields[4], OpenMayaRender.MUIDrawManager.kCenter, background_size
+        draw_manager.endDrawable()
+
+    def get_draw_plan(self, data, mask_x, mask_width, mask_y_top, mask_y_bottom, background_size):
+        # one plan per viewport geometry, so panes of different sizes do not rebuild each other's plan
+        geometry_key = (mask_x, mask_width, mask_y_top, mask_y_bottom, background_size)
+        plan_key = (
+            tuple(data.text_fields), data.text_styles,
+            data.top_text_padding, data.bottom_text_padding, data.top_text_fit, data.bottom_text_fit
         )
-        self.draw_text(
-            draw_manager, OpenMaya.MPoint(mask_x+mask_width-data.bottom_text_padding, mask_y_bottom),
-            data.text_fields[5], OpenMayaRender.MUIDrawManager.kRight, background_size
+        cached = self.draw_plans.pop(geometry_key, None)
+        if cached is None or cached[0] != plan_key:
+            slot_keys = self.get_slot_keys(data, mask_x, mask_width, mask_y_top, mask_y_bottom, background_size)
+            cached = (plan_key, self.build_draw_plan(slot_keys))
+        self.draw_plans[geometry_key] = cached
+        if len(self.draw_plans) > DRAW_PLAN_CACHE_SIZE:
+            self.draw_plans.popitem(last=False)
+        return cached[1]
+
+    @staticmethod
+    def get_slot_keys(data, mask_x, mask_width, mask_y_top, mask_y_bottom, background_size):
+        border_height = background_size[1]
+        rows = (
+            (mask_y_top-border_height, data.top_text_padding, data.top_text_fit),
+            (mask_y_bottom, data.bottom_text_padding, data.bottom_text_fit),
         )
+        # each field owns a third of the mask width, left / right lose their padding
+        column_width = mask_width / 3.0
+        slot_keys = []
+        for index, (text, style) in enumerate(zip(data.text_fields, data.text_styles)):
+            y, padding, fit_mode = rows[index // 3]
+            column = index % 3
+            if column == 0:
+                x, max_width, alignment = mask_x+padding, column_width-padding, OpenMayaRender.MUIDrawManager.kLeft
+            elif column == 1:
+                x, max_width, alignment = mask_x+mask_width*0.5, column_width, OpenMayaRender.MUIDrawManager.kCenter
+            else:
+                x, max_width, alignment = (
+                    mask_x+mask_width-padding, column_width-padding, OpenMayaRender.MUIDrawManager.kRight
+                )
+            slot_keys.append((text, style, x, y, max_width, alignment, background_size, fit_mode))
+        return slot_keys
+
+    def build_draw_plan(self, slot_keys):
+        """
+        Group the laid out lines of every slot by (color, font size, font weight),
+        so each style state is set once per frame.
+        Slots whose key did not change reuse their previous layout.
+        """
+        groups = {}
+        for slot_key in slot_keys:
+            layout = self.slot_layouts.pop(slot_key, None)
+            if layout is None:
+                layout = self.layout_slot(*slot_key)
+                if len(self.slot_layouts) >= DRAW_PLAN_CACHE_SIZE * MagicMaskNode.TEXT_POSITION_NUMBER:
+                    self.slot_layouts.popitem(last=False)
+            self.slot_layouts[slot_key] = layout
+            for style_state, line in layout:
+                groups.setdefault(style_state, []).append(line)
+
+        # neighbouring groups mostly share color / font weight, which skips those state changes
+        return [
+            (style_state, OpenMaya.MColor(style_state[0]), groups[style_state])
+            for style_state in sorted(groups, key=lambda state: (state[0], state[2], state[1]))
+        ]
 
-        draw_manager.endDrawable()
+    def layout_slot(self, text, style, x, y, max_width, alignment, background_size, fit_mode):
+        color, scale, font_weight = style
+        background_width, border_height = background_size
+        lines = text.splitlines()
+        if not lines:
+            return []
+
+        # short borders (small panes, tight crops) with a low scale round down to 0
+        font_size = max(int(border_height * 0.25 * scale), 1)
+        if len(lines) == 1:
+            line_height = border_height
+        else:
+            if fit_mode == 'Shrink':
+                font_size = min(
+                    font_size, max(int(border_height / (len(lines) * TEXT_LINE_SPACING)), TEXT_MIN_FONT_SIZE)
+                )
+            line_height = font_size * TEXT_LINE_SPACING
+            # lines still overflowing the border are dropped, Truncate marks the cut with an ellipsis
+            max_lines = max(int(border_height // line_height), 1)
+            if len(lines) > max_lines:
+                lines = lines[:max_lines]
+                if fit_mode == 'Truncate':
+                    lines[-1] = lines[-1].rstrip() + TEXT_ELLIPSIS
+        # lines are stacked downwards, the whole block centered in the border
+        top = y + 0.5 * (border_height + len(lines) * line_height)
+
+        layout = []
+        for index, line in enumerate(lines):
+            line, line_font_size = self.text_metrics.fit(line, font_size, font_weight, max_width, fit_mode)
+            if not line:
+                continue
+            position = OpenMaya.MPoint(x, top - (index + 1) * line_height)
+            layout.append((
+                (color, line_font_size, font_weight),
+                (position, line, alignment, (background_width, int(line_height)))
+            ))
+        return layout
 
     @staticmethod
     def draw_text(draw_manager, position, text, alignment, background_size):
@@ -542,9 +974,21 @@ def initializePlugin(obj):
         sys.stderr.write('Loading Error')
         raise Exception('Failed to register magicMaskDrawOverride.')
 
+    try:
+        REFRESH_SCHEDULER.start()
+    except RuntimeError:
+        sys.stderr.write('Loading Error')
+        raise Exception('Failed to register magicMask refresh timer.')
+
 
 def uninitializePlugin(obj):
     plugin = OpenMaya.MFnPlugin(obj)
+    try:
+        REFRESH_SCHEDULER.stop()
+    except RuntimeError:
+        sys.stderr.write('Removing Error')
+        raise Exception('Failed to de-register magicMask refresh timer.')
+
     try:
         OpenMayaRender.MDrawRegistry.deregisterDrawOverrideCreator(
             MagicMaskNode.DRAW_DB_CLASSIFICATION,
@@ -615,29 +1059,43 @@ class AEmagicMaskTemplate(NodeTemplate):
         self.beginScrollLayout()
 
         self.beginLayout('Top Text', collapse=False)
-        self.addControl('top_left_text', label='Left', preventOverride=True)
-        self.addControl('top_center_text', label='Center', preventOverride=False)
-        self.addControl('top_right_text', label='Right', preventOverride=False)
+        self.callCustom(self.text_field_new, self.text_field_replace, 'top_left_text')
+        self.callCustom(self.text_field_new, self.text_field_replace, 'top_center_text')
+        self.callCustom(self.text_field_new, self.text_field_replace, 'top_right_text')
         self.addSeparator()
         self.addControl('top_text_padding', label='Padding', preventOverride=False)
         self.addControl('top_text_font_weight', label='Font', preventOverride=False)
         self.addControl('top_text_scale', label='Scale', preventOverride=False)
+        self.addControl('top_text_fit', label='Fit', preventOverride=False)
         self.addControl('top_text_color', label='Color', preventOverride=False)
         self.addControl('top_text_alpha', label='Alpha', preventOverride=False)
         self.endLayout()
 
         self.beginLayout('Bottom Text', collapse=False)
-        self.addControl('bottom_left_text', label='Left', preventOverride=True)
-        self.addControl('bottom_center_text', label='Center', preventOverride=False)
-        self.addControl('bottom_right_text', label='Right', preventOverride=False)
+        self.callCustom(self.text_field_new, self.text_field_replace, 'bottom_left_text')
+        self.callCustom(self.text_field_new, self.text_field_replace, 'bottom_center_text')
+        self.callCustom(self.text_field_new, self.text_field_replace, 'bottom_right_text')
         self.addSeparator()
         self.addControl('bottom_text_padding', label='Padding', preventOverride=False)
         self.addControl('bottom_text_font_weight', label='Font', preventOverride=False)
         self.addControl('bottom_text_scale', label='Scale', preventOverride=False)
+        self.addControl('bottom_text_fit', label='Fit', preventOverride=False)
         self.addControl('bottom_text_color', label='Color', preventOverride=False)
         self.addControl('bottom_text_alpha', label='Alpha', preventOverride=False)
         self.endLayout()
 
+        self.beginLayout('Text Styles', collapse=True)
+        self.addControl('text_font', label='Font Name', preventOverride=False)
+        for text_attribute in MagicMaskNode.TEXT_ATTRIBUTES:
+            self.beginLayout(text_attribute[:-len('_text')].replace('_', ' ').title(), collapse=True)
+            self.addControl('{0}_style_override'.format(text_attribute), label='Override', preventOverride=False)
+            self.addControl('{0}_font_weight'.format(text_attribute), label='Font', preventOverride=False)
+            self.addControl('{0}_scale'.format(text_attribute), label='Scale', preventOverride=False)
+            self.addControl('{0}_color'.format(text_attribute), label='Color', preventOverride=False)
+            self.addControl('{0}_alpha'.format(text_attribute), label='Alpha', preventOverride=False)
+            self.endLayout()
+        self.endLayout()
+
         self.beginLayout('Border', collapse=False)
         self.addControl('top_border_enabled', label='Top Enabled', preventOverride=True)
         self.addControl('bottom_border_enabled', label='Bottom Enabled', preventOverride=True)
@@ -681,6 +1139,16 @@ class AEmagicMaskTemplate(NodeTemplate):
         self.addControl('focal_length_position', label='Position', preventOverride=True)
         self.endLayout()
 
+        self.beginLayout('Live', collapse=False)
+        self.addControl('clock_position', label='Clock Position', preventOverride=True)
+        self.addControl('clock_format', label='Clock Format', preventOverride=True)
+        self.addSeparator()
+        self.addControl('note_position', label='Note Position', preventOverride=True)
+        self.addControl('note_file', label='Note File', preventOverride=True)
+        self.addSeparator()
+        self.addControl('refresh_rate', label='Refresh Rate', preventOverride=True)
+        self.endLayout()
+
         # self.addExtraControls()
         self.suppress_attributes()
         self.endScrollLayout()
@@ -706,3 +1174,24 @@ class AEmagicMaskTemplate(NodeTemplate):
         value = 1 - self.current_node.cut_frame_enabled.get()
         self.dimControl(self.current_node, 'cut_in', value)
         self.dimControl(self.current_node, 'cut_out', value)
+
+    # scroll fields instead of the default text field, so slots can hold several lines
+    def text_field_new(self, plug):
+        attribute = plug.split('.')[-1]
+        pm.rowLayout(
+            numberOfColumns=2, columnWidth2=(145, 240), adjustableColumn=2,
+            columnAttach2=('right', 'both'), columnOffset2=(5, 0)
+        )
+        pm.text(label=attribute.split('_')[1].title())
+        pm.scrollField('magicMask_{0}_field'.format(attribute), height=48, wordWrap=False)
+        pm.setParent('..')
+        self.text_field_replace(plug)
+
+    def text_field_replace(self, plug):
+        field = 'magicMask_{0}_field'.format(plug.split('.')[-1])
+        pm.scrollField(
+            field, edit=True, text=pm.general.getAttr(plug) or '',
+            changeCommand=lambda *args: pm.general.setAttr(
+                plug, pm.scrollField(field, query=True, text=True), type='string'
+            )
+        )